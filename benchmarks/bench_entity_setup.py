@@ -0,0 +1,127 @@
+"""Benchmark widget platform setup on a large virtual console.
+
+Sets up the switch platform through a real ``EntityPlatform`` on a minimal
+Home Assistant instance, with a coordinator holding 5,000 button widgets, and
+reports the setup time and the longest time the event loop was blocked. Run
+from the repository root:
+
+    python benchmarks/bench_entity_setup.py
+"""
+
+import asyncio
+import logging
+import sys
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import MagicMock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from homeassistant import config_entries  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.helpers import (  # noqa: E402
+    area_registry as ar,
+    device_registry as dr,
+    entity,
+    entity_registry as er,
+    floor_registry as fr,
+    label_registry as lr,
+)
+from homeassistant.helpers.entity_platform import EntityPlatform  # noqa: E402
+
+from custom_components.qlcplus import switch  # noqa: E402
+from custom_components.qlcplus.const import DOMAIN, WIDGET_TYPE_BUTTON  # noqa: E402
+from custom_components.qlcplus.coordinator import (  # noqa: E402
+    QLCPlusDataUpdateCoordinator,
+)
+
+WIDGET_COUNT = 5000
+ROUNDS = 3
+
+
+async def _watch_event_loop(stalls: list[float], stop: asyncio.Event) -> None:
+    """Record the gaps between two turns of the event loop."""
+    last = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(0)
+        now = time.perf_counter()
+        stalls.append(now - last)
+        last = now
+
+
+async def _run_once(widget_count: int) -> tuple[float, float, int]:
+    """Set up the platform once and return time, longest stall and entity count."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        entity.async_setup(hass)
+        for registry in (ar, fr, lr, dr, er):
+            await registry.async_load(hass)
+
+        entry = config_entries.ConfigEntry(
+            version=1,
+            minor_version=1,
+            domain=DOMAIN,
+            title="QLC+",
+            data={"host": "bench"},
+            source=config_entries.SOURCE_USER,
+            unique_id="bench",
+        )
+        hass.config_entries._entries[entry.entry_id] = entry
+
+        coordinator = QLCPlusDataUpdateCoordinator(hass, MagicMock(), entry)
+        coordinator.data = {
+            str(widget_id): {
+                "id": str(widget_id),
+                "name": f"Button {widget_id}",
+                "type": WIDGET_TYPE_BUTTON,
+                "status": "0",
+            }
+            for widget_id in range(widget_count)
+        }
+        hass.data[entry.entry_id] = coordinator
+
+        platform = EntityPlatform(
+            hass=hass,
+            logger=logging.getLogger(__name__),
+            domain="switch",
+            platform_name=DOMAIN,
+            platform=switch,
+            scan_interval=timedelta(seconds=30),
+            entity_namespace=None,
+        )
+
+        stalls: list[float] = []
+        stop = asyncio.Event()
+        watcher = asyncio.create_task(_watch_event_loop(stalls, stop))
+        await asyncio.sleep(0)
+
+        start = time.perf_counter()
+        await platform.async_setup_entry(entry)
+        elapsed = time.perf_counter() - start
+
+        stop.set()
+        await watcher
+
+        count = len(platform.entities)
+        await hass.async_stop(force=True)
+
+    return elapsed, max(stalls), count
+
+
+async def main() -> None:
+    """Run the benchmark and print the results."""
+    results = [await _run_once(WIDGET_COUNT) for _ in range(ROUNDS)]
+    best = min(elapsed for elapsed, _, _ in results)
+    worst_stall = max(stall for _, stall, _ in results)
+    count = results[0][2]
+
+    print(f"widgets: {WIDGET_COUNT}, entities added: {count}")
+    print(f"setup time (best of {ROUNDS}): {best * 1000:.1f} ms")
+    print(f"longest event loop stall: {worst_stall * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,13 +1,40 @@
 """QLC+ Integration."""
 
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse
 from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import config_validation as cv, device_registry as dr
 
 from .api import QLCPlusAPI
-from .const import DOMAIN, PLATFORMS, SERVICE_SEND_COMMAND
-from .coordinator import QLCPlusDataUpdateCoordinator
+from .const import (
+    DOMAIN,
+    PLATFORMS,
+    SERVICE_RESTORE_SNAPSHOT,
+    SERVICE_SEND_COMMAND,
+    SERVICE_SNAPSHOT,
+)
+from .coordinator import QLCPlusDataUpdateCoordinator, snapshot_store
+
+SNAPSHOT_SERVICE_SCHEMA = cv.make_entity_service_schema(
+    {vol.Required("name"): cv.string}
+)
+
+
+def _coordinators_for_devices(
+    hass: HomeAssistant, devices: list[str]
+) -> list[QLCPlusDataUpdateCoordinator]:
+    """Return the coordinators of the config entries behind the given devices."""
+    coordinators = []
+    device_reg = dr.async_get(hass)
+    for device_id in devices:
+        device = device_reg.async_get(device_id)
+        if device:
+            for config_entry_id in device.config_entries:
+                if config_entry_id in hass.data:
+                    coordinators.append(hass.data[config_entry_id])
+    return coordinators
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -22,8 +49,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     api = QLCPlusAPI(host=host, port=port,
                      username=username, password=password)
 
-    coordinator = QLCPlusDataUpdateCoordinator(hass, api)
+    coordinator = QLCPlusDataUpdateCoordinator(hass, api, entry)
 
+    await coordinator.async_load_snapshots()
     await coordinator.async_config_entry_first_refresh()
     if not coordinator.last_update_success:
         raise ConfigEntryNotReady
@@ -36,25 +64,44 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         command = call.data.get("command")
         devices = call.data.get("device_id", [])
 
-        device_reg = dr.async_get(hass)
-        for device_id in devices:
-            device = device_reg.async_get(device_id)
-            if device:
-                for config_entry_id in device.config_entries:
-                    if config_entry_id in hass.data:
-                        target_coordinator = hass.data[config_entry_id]
-                        response = await target_coordinator.api.send_command_and_wait_for_response(
-                            command
-                        )
-                        return {"response": response}
+        for target_coordinator in _coordinators_for_devices(hass, devices):
+            response = await target_coordinator.api.send_command_and_wait_for_response(
+                command
+            )
+            return {"response": response}
         return {"response": "No valid device found."}
 
+    async def snapshot_service(call: ServiceCall) -> None:
+        """Handle the service call to snapshot the virtual console state."""
+        name = call.data["name"]
+        devices = call.data.get("device_id", [])
+
+        for target_coordinator in _coordinators_for_devices(hass, devices):
+            await target_coordinator.async_take_snapshot(name)
+
+    async def restore_snapshot_service(call: ServiceCall) -> None:
+        """Handle the service call to restore a virtual console snapshot."""
+        name = call.data["name"]
+        devices = call.data.get("device_id", [])
+
+        for target_coordinator in _coordinators_for_devices(hass, devices):
+            await target_coordinator.async_restore_snapshot(name)
+
     hass.services.async_register(
         DOMAIN,
         SERVICE_SEND_COMMAND,
         send_command_service,
         supports_response=SupportsResponse.ONLY,
     )
+    hass.services.async_register(
+        DOMAIN, SERVICE_SNAPSHOT, snapshot_service, schema=SNAPSHOT_SERVICE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RESTORE_SNAPSHOT,
+        restore_snapshot_service,
+        schema=SNAPSHOT_SERVICE_SCHEMA,
+    )
 
     return True
 
@@ -67,5 +114,12 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     if not hass.data:
         hass.services.async_remove(DOMAIN, SERVICE_SEND_COMMAND)
+        hass.services.async_remove(DOMAIN, SERVICE_SNAPSHOT)
+        hass.services.async_remove(DOMAIN, SERVICE_RESTORE_SNAPSHOT)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored snapshots of a config entry."""
+    await snapshot_store(hass, entry.entry_id).async_remove()
@@ -34,6 +34,7 @@ class QLCPlusAPI:
         self._password = password
         self._ws = None
         self._timeout = timeout
+        self._lock = asyncio.Lock()
 
     async def connect(self) -> None:
         """Establish a WebSocket connection to the QLC+ server."""
@@ -64,42 +65,85 @@ class QLCPlusAPI:
                 "Connection refused when connecting to QLC+ at %s", url)
             raise QLCPlusConnectionError("Connection refused") from exc
 
+    async def _ensure_connected(self):
+        """Return the open connection, connecting first if there is none.
+
+        Connecting happens under the same lock as the pipelined sweeps, so a
+        write can never open a second connection alongside a sweep.
+        """
+        async with self._lock:
+            if not self._ws:
+                await self.connect()
+            return self._ws
+
+    def _drop_connection(self, ws) -> None:
+        """Forget a closed connection unless it has already been replaced."""
+        if self._ws is ws:
+            self._ws = None
+
     async def send_command_and_wait_for_response(
         self, command: str, is_retry=False
     ) -> str:
         """Send a command to the QLC+ server and return the response."""
-        if not self._ws:
-            await self.connect()
+        responses = await self.send_commands_and_wait_for_responses(
+            [command], is_retry=is_retry
+        )
+        return responses[0]
 
-        try:
-            async with asyncio.timeout(self._timeout):
-                await self._ws.send(command)
-                command_prefix = "|".join(command.split("|")[:2])
-                while True:
-                    response = await self._ws.recv()
-                    if response.startswith(command_prefix):
-                        break
-                LOGGER.debug(
-                    "Sent command: %s, received response: %s", command, response
-                )
-                return response
-        except TimeoutError as exc:
-            LOGGER.error("Timed out waiting for response from QLC+")
-            raise QLCPlusConnectionError(
-                "Timed out waiting for response") from exc
-        except websockets.exceptions.ConnectionClosed:
-            self._ws = None
-            if not is_retry:
-                return await self.send_command_and_wait_for_response(
-                    command, is_retry=True
-                )
-            raise
+    async def send_commands_and_wait_for_responses(
+        self, commands: list[str], is_retry=False
+    ) -> list[str]:
+        """Pipeline several commands to the QLC+ server and return the responses.
+
+        All commands are written before any response is read. QLC+ answers
+        them in order, so responses are returned in the same order as the
+        commands.
+        """
+        if not commands:
+            return []
+
+        async with self._lock:
+            if not self._ws:
+                await self.connect()
+
+            try:
+                for command in commands:
+                    await self._ws.send(command)
+                responses = []
+                for command in commands:
+                    command_prefix = "|".join(command.split("|")[:2])
+                    async with asyncio.timeout(self._timeout):
+                        while True:
+                            response = await self._ws.recv()
+                            if response.startswith(command_prefix):
+                                break
+                    LOGGER.debug(
+                        "Sent command: %s, received response: %s", command, response
+                    )
+                    responses.append(response)
+                return responses
+            except TimeoutError as exc:
+                LOGGER.error("Timed out waiting for response from QLC+")
+                # Replies to the pipelined commands may still arrive and carry
+                # no widget ID, so drop the connection rather than let a later
+                # command read them as its own.
+                await self.disconnect()
+                raise QLCPlusConnectionError(
+                    "Timed out waiting for response") from exc
+            except websockets.exceptions.ConnectionClosed:
+                self._ws = None
+                if is_retry:
+                    raise
+
+        return await self.send_commands_and_wait_for_responses(
+            commands, is_retry=True
+        )
 
     async def disconnect(self) -> None:
         """Close the WebSocket connection."""
         if self._ws:
-            await self._ws.close()
-            self._ws = None
+            ws, self._ws = self._ws, None
+            await ws.close()
             LOGGER.debug("Disconnected from QLC+")
 
     async def get_list_of_widgets(self) -> dict[str, str]:
@@ -123,65 +167,115 @@ class QLCPlusAPI:
 
         return widgets
 
-    async def get_widget_status(self, widget_id: str) -> str:
-        """Retrieve the status of a specific widget by its ID."""
-        command = f"QLC+API|getWidgetStatus|{widget_id}"
-        response = await self.send_command_and_wait_for_response(command)
+    async def get_widgets_status(self, widget_ids: list[str]) -> dict[str, str]:
+        """Retrieve the status of several widgets in one pipelined sweep."""
+        commands = [
+            f"QLC+API|getWidgetStatus|{widget_id}" for widget_id in widget_ids
+        ]
+        responses = await self.send_commands_and_wait_for_responses(commands)
 
-        response_parts = response.split("|")
+        return {
+            widget_id: response.split("|", 2)[2]
+            for widget_id, response in zip(widget_ids, responses)
+        }
+
+    async def get_widgets_type(self, widget_ids: list[str]) -> dict[str, str]:
+        """Retrieve the type of several widgets in one pipelined sweep."""
+        commands = [f"QLC+API|getWidgetType|{widget_id}" for widget_id in widget_ids]
+        responses = await self.send_commands_and_wait_for_responses(commands)
+
+        return {
+            widget_id: response.split("|")[2]
+            for widget_id, response in zip(widget_ids, responses)
+        }
+
+    async def get_widgets_status_and_gm(
+        self, widget_ids: list[str]
+    ) -> tuple[dict[str, str], int]:
+        """Retrieve the status of several widgets and the GM in one sweep."""
+        commands = [
+            f"QLC+API|getWidgetStatus|{widget_id}" for widget_id in widget_ids
+        ]
+        commands.append("QLC+API|getGMValue")
+        responses = await self.send_commands_and_wait_for_responses(commands)
+
+        statuses = {
+            widget_id: response.split("|", 2)[2]
+            for widget_id, response in zip(widget_ids, responses)
+        }
+        gm_value = int(responses[-1].split("|")[2])
 
-        return response_parts[2]
+        return statuses, gm_value
 
     async def set_widget_value(
-        self, widget_id: str, value: int, is_retry: bool = False
+        self, widget_id: str, value: int | str, is_retry: bool = False
     ) -> None:
         """Set the value of a specific widget by its ID."""
-        if not self._ws:
-            await self.connect()
+        ws = await self._ensure_connected()
 
         command = f"{widget_id}|{value}"
         try:
-            await self._ws.send(command)
+            await ws.send(command)
         except websockets.exceptions.ConnectionClosed:
-            self._ws = None
+            self._drop_connection(ws)
             if not is_retry:
                 return await self.set_widget_value(widget_id, value, is_retry=True)
             raise
 
+    async def set_widget_values(
+        self,
+        values: list[tuple[str, str]],
+        gm_value: int | None = None,
+        is_retry: bool = False,
+    ) -> None:
+        """Send several widget values, in order, and optionally the GM in one burst."""
+        commands = [f"{widget_id}|{value}" for widget_id, value in values]
+        if gm_value is not None:
+            commands.append(f"GM_VALUE|{gm_value}")
+        if not commands:
+            return
+        ws = await self._ensure_connected()
+
+        try:
+            for command in commands:
+                await ws.send(command)
+        except websockets.exceptions.ConnectionClosed:
+            self._drop_connection(ws)
+            if not is_retry:
+                return await self.set_widget_values(values, gm_value, is_retry=True)
+            raise
+
     async def set_gm_value(
         self, value: int, is_retry: bool = False
     ) -> None:
         """Set the value of the GM slider"""
-        if not self._ws:
-            await self.connect()
+        ws = await self._ensure_connected()
 
         command = f"GM_VALUE|{value}"
         try:
-            await self._ws.send(command)
+            await ws.send(command)
         except websockets.exceptions.ConnectionClosed:
-            self._ws = None
+            self._drop_connection(ws)
             if not is_retry:
-                return await self.set_widget_value(widget_id, value, is_retry=True)
+                return await self.set_gm_value(value, is_retry=True)
             raise
 
     async def reset_simple_desk(self, is_retry: bool = False) -> None:
         """Resets Simple Desk value."""
-        if not self._ws:
-            await self.connect()
+        ws = await self._ensure_connected()
         command = "QLC+API|sdResetUniverse|1"
         try:
-            await self._ws.send(command)
+            await ws.send(command)
         except websockets.exceptions.ConnectionClosed:
-            self._ws = None
+            self._drop_connection(ws)
             if not is_retry:
                 return await self.reset_simple_desk(is_retry=True)
             raise
 
     async def stop_functions(self, is_retry: bool = False) -> None:
         """Resets Simple Desk value."""
-        if not self._ws:
-            await self.connect()
         command = "QLC+API|getFunctionsList"
+        ws = None
         try:
             response = await self.send_command_and_wait_for_response(command)
             response_parts = response.split("|")
@@ -189,11 +283,12 @@ class QLCPlusAPI:
                 response_parts[i]
                 for i in range(2, len(response_parts), 2)
             ]
+            ws = await self._ensure_connected()
             for function_id in function_ids:
                 command = f"QLC+API|setFunctionStatus|{function_id}|0"
-                await self._ws.send(command)
+                await ws.send(command)
         except websockets.exceptions.ConnectionClosed:
-            self._ws = None
+            self._drop_connection(ws)
             if not is_retry:
                 return await self.stop_functions(is_retry=True)
             raise
@@ -3,12 +3,12 @@
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import CUE_LIST_NEXT, CUE_LIST_PREVIOUS, WIDGET_TYPE_CUE_LIST
 from .coordinator import QLCPlusDataUpdateCoordinator
+from .entity import QLCPlusWidgetEntity, async_setup_widget_platform
 
 
 async def async_setup_entry(
@@ -25,6 +25,21 @@ async def async_setup_entry(
     )
     async_add_entities([reset_desk, stop_functions], update_before_add=True)
 
+    await async_setup_widget_platform(
+        hass,
+        entry,
+        async_add_entities,
+        WIDGET_TYPE_CUE_LIST,
+        QLCPlusCueListPreviousButtonEntity,
+    )
+    await async_setup_widget_platform(
+        hass,
+        entry,
+        async_add_entities,
+        WIDGET_TYPE_CUE_LIST,
+        QLCPlusCueListNextButtonEntity,
+    )
+
 
 class QLCPlusResetButtonEntity(CoordinatorEntity, ButtonEntity):
     """Representation of the QLC+ reset Simple Desk Button."""
@@ -34,16 +49,9 @@ class QLCPlusResetButtonEntity(CoordinatorEntity, ButtonEntity):
     ) -> None:
         """Initialize the number."""
         super().__init__(coordinator)
-        self._entry = entry
         self._attr_unique_id = f"{entry.unique_id}_reset_desk"
         self._attr_name = f"{entry.title} Reset Simple Desk"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return the device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.unique_id)}, name=self._entry.title
-        )
+        self._attr_device_info = coordinator.device_info
 
     async def async_press(self) -> None:
         """Reset Simple Desk."""
@@ -58,17 +66,32 @@ class QLCPlusStopButtonEntity(CoordinatorEntity, ButtonEntity):
     ) -> None:
         """Initialize the button."""
         super().__init__(coordinator)
-        self._entry = entry
         self._attr_unique_id = f"{entry.unique_id}_stop_functions"
         self._attr_name = f"{entry.title} Stop All Functions"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return the device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.unique_id)}, name=self._entry.title
-        )
+        self._attr_device_info = coordinator.device_info
 
     async def async_press(self) -> None:
         """Stop Functions."""
         await self.coordinator.api.stop_functions()
+
+
+class QLCPlusCueListPreviousButtonEntity(QLCPlusWidgetEntity, ButtonEntity):
+    """Representation of the previous cue action of a QLC+ cue list widget."""
+
+    unique_id_suffix = "_previous"
+    name_suffix = " Previous"
+
+    async def async_press(self) -> None:
+        """Go to the previous cue."""
+        await self.coordinator.api.set_widget_value(self.widget_id, CUE_LIST_PREVIOUS)
+
+
+class QLCPlusCueListNextButtonEntity(QLCPlusWidgetEntity, ButtonEntity):
+    """Representation of the next cue action of a QLC+ cue list widget."""
+
+    unique_id_suffix = "_next"
+    name_suffix = " Next"
+
+    async def async_press(self) -> None:
+        """Go to the next cue."""
+        await self.coordinator.api.set_widget_value(self.widget_id, CUE_LIST_NEXT)
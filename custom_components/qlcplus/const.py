@@ -6,7 +6,7 @@ DOMAIN = "qlcplus"
 LOGGER = logging.getLogger(__package__)
 
 # Platforms to be set up
-PLATFORMS = ["number", "switch", "button"]
+PLATFORMS = ["number", "switch", "select", "button"]
 
 # Default values
 DEFAULT_NAME = "QLC+"
@@ -14,5 +14,32 @@ DEFAULT_PORT = 9999
 DEFAULT_TIMEOUT = 5
 DEFAULT_SCAN_INTERVAL = 30
 
+# Number of widget entities added before yielding to the event loop
+ENTITY_SETUP_CHUNK_SIZE = 500
+
+# Virtual console widget types, as reported by getWidgetType
+WIDGET_TYPE_BUTTON = "Button"
+WIDGET_TYPE_SLIDER = "Slider"
+WIDGET_TYPE_CUE_LIST = "Cue list"
+SUPPORTED_WIDGET_TYPES = {WIDGET_TYPE_BUTTON, WIDGET_TYPE_SLIDER, WIDGET_TYPE_CUE_LIST}
+
+# Widget values
+BUTTON_PRESSED = "255"
+BUTTON_RELEASED = "0"
+SLIDER_MIN_VALUE = 0
+SLIDER_MAX_VALUE = 255
+CUE_LIST_PLAY = "PLAY"
+CUE_LIST_STOP = "STOP"
+CUE_LIST_STEP = "STEP"
+CUE_LIST_PREVIOUS = "PREV"
+CUE_LIST_NEXT = "NEXT"
+CUE_LIST_OPTIONS = {"Stop": CUE_LIST_STOP, "Play": CUE_LIST_PLAY}
+
+# Snapshot storage
+SNAPSHOT_STORAGE_KEY = f"{DOMAIN}.snapshots"
+SNAPSHOT_STORAGE_VERSION = 1
+
 # Service names
 SERVICE_SEND_COMMAND = "send_command"
+SERVICE_SNAPSHOT = "snapshot"
+SERVICE_RESTORE_SNAPSHOT = "restore_snapshot"
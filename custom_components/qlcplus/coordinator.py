@@ -2,18 +2,75 @@
 
 from datetime import timedelta
 
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import QLCPlusAPI, QLCPlusAuthError, QLCPlusConnectionError
-from .const import DEFAULT_SCAN_INTERVAL, DOMAIN, LOGGER
+from .const import (
+    BUTTON_PRESSED,
+    BUTTON_RELEASED,
+    CUE_LIST_PLAY,
+    CUE_LIST_STEP,
+    CUE_LIST_STOP,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    LOGGER,
+    SNAPSHOT_STORAGE_KEY,
+    SNAPSHOT_STORAGE_VERSION,
+    SUPPORTED_WIDGET_TYPES,
+    WIDGET_TYPE_BUTTON,
+    WIDGET_TYPE_CUE_LIST,
+    WIDGET_TYPE_SLIDER,
+)
+
+
+def snapshot_store(hass: HomeAssistant, entry_id: str) -> Store:
+    """Return the store holding the snapshots of a config entry."""
+    return Store(hass, SNAPSHOT_STORAGE_VERSION, f"{SNAPSHOT_STORAGE_KEY}.{entry_id}")
+
+
+def _restore_values(widget_type: str, current: str, target: str) -> list[str]:
+    """Return the values that take a widget from its current status to target."""
+    if current == target:
+        return []
+
+    if widget_type == WIDGET_TYPE_BUTTON:
+        if target == BUTTON_PRESSED:
+            return [BUTTON_PRESSED]
+        if current == BUTTON_PRESSED:
+            # Pressing toggles a toggle button off, releasing ends a flash.
+            return [BUTTON_PRESSED, BUTTON_RELEASED]
+    elif widget_type == WIDGET_TYPE_SLIDER:
+        if target.isdigit():
+            return [target]
+    elif widget_type == WIDGET_TYPE_CUE_LIST:
+        target_parts = target.split("|")
+        if target_parts[0] == CUE_LIST_STOP:
+            return [CUE_LIST_STOP]
+        if target_parts[0] == CUE_LIST_PLAY and len(target_parts) > 1:
+            return [f"{CUE_LIST_STEP}|{target_parts[1]}"]
+
+    return []
 
 
 class QLCPlusDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching QLC+ data."""
 
-    def __init__(self, hass, api: QLCPlusAPI) -> None:
+    def __init__(self, hass, api: QLCPlusAPI, entry: ConfigEntry) -> None:
         """Initialize the coordinator."""
         self.api = api
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.unique_id)}, name=entry.title
+        )
+        self.widget_types: dict[str, str] = {}
+        self.gm_value: int | None = None
+        self._widget_catalog: dict[str, str] = {}
+        self.snapshots: dict[str, dict] = {}
+        self._snapshot_store = snapshot_store(hass, entry.entry_id)
         super().__init__(
             hass,
             LOGGER,
@@ -25,13 +82,28 @@ class QLCPlusDataUpdateCoordinator(DataUpdateCoordinator):
         """Fetch data from QLC+."""
         try:
             widgets = await self.api.get_list_of_widgets()
+            if widgets != self._widget_catalog:
+                # A workspace reload can reuse widget IDs, so any catalog
+                # change invalidates every cached type.
+                self.widget_types = await self.api.get_widgets_type(list(widgets))
+                self._widget_catalog = widgets
+                for widget_id, widget_type in self.widget_types.items():
+                    if widget_type not in SUPPORTED_WIDGET_TYPES:
+                        LOGGER.warning(
+                            "Widget %s (%s) has unsupported type %s, "
+                            "no entity will be created for it",
+                            widget_id,
+                            widgets[widget_id],
+                            widget_type,
+                        )
+            statuses = await self.api.get_widgets_status(list(widgets))
             data = {}
             for widget_id, widget_name in widgets.items():
-                widget_status = await self.api.get_widget_status(widget_id)
                 data[widget_id] = {
                     "id": widget_id,
                     "name": widget_name,
-                    "status": widget_status,
+                    "type": self.widget_types[widget_id],
+                    "status": statuses[widget_id],
                 }
         except QLCPlusAuthError as exc:
             raise UpdateFailed("Authentication error") from exc
@@ -42,3 +114,66 @@ class QLCPlusDataUpdateCoordinator(DataUpdateCoordinator):
             raise UpdateFailed("An unknown error occurred") from exc
 
         return data
+
+    async def async_load_snapshots(self) -> None:
+        """Load the stored snapshots."""
+        self.snapshots = await self._snapshot_store.async_load() or {}
+
+    async def async_take_snapshot(self, name: str) -> None:
+        """Capture the status of every widget and the GM into a snapshot."""
+        widget_ids = list(self.data or {})
+        statuses, gm_value = await self.api.get_widgets_status_and_gm(widget_ids)
+
+        self.gm_value = gm_value
+        self.snapshots[name] = {"widgets": statuses, "gm": gm_value}
+        await self._snapshot_store.async_save(self.snapshots)
+        LOGGER.debug(
+            "Stored snapshot %s with %d widgets", name, len(statuses)
+        )
+
+    async def async_restore_snapshot(self, name: str) -> None:
+        """Restore a snapshot, sending only the widgets that differ."""
+        if name not in self.snapshots:
+            raise ServiceValidationError(f"Unknown snapshot: {name}")
+
+        snapshot = self.snapshots[name]
+        data = self.data or {}
+        # Buttons are restored by pressing them, which flips toggle buttons, so
+        # diff against a fresh sweep rather than the last poll.
+        widget_ids = [widget_id for widget_id in snapshot["widgets"] if widget_id in data]
+        current, current_gm_value = await self.api.get_widgets_status_and_gm(
+            widget_ids
+        )
+
+        statuses = {}
+        values = []
+        for widget_id in widget_ids:
+            status = snapshot["widgets"][widget_id]
+            widget_values = _restore_values(
+                data[widget_id]["type"], current[widget_id], status
+            )
+            if widget_values:
+                values.extend((widget_id, value) for value in widget_values)
+                statuses[widget_id] = status
+            else:
+                statuses[widget_id] = current[widget_id]
+
+        gm_value = snapshot["gm"] if snapshot["gm"] != current_gm_value else None
+        await self.api.set_widget_values(values, gm_value)
+        LOGGER.debug(
+            "Restored snapshot %s, %d values sent, GM %s",
+            name,
+            len(values),
+            "changed" if gm_value is not None else "unchanged",
+        )
+
+        self.gm_value = snapshot["gm"]
+
+        self.async_set_updated_data(
+            {
+                widget_id: {**widget, "status": statuses[widget_id]}
+                if widget_id in statuses
+                else widget
+                for widget_id, widget in data.items()
+            }
+        )
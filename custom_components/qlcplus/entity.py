@@ -0,0 +1,153 @@
+"""Base entity for QLC+ virtual console widgets."""
+
+import asyncio
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity_platform import (
+    AddEntitiesCallback,
+    async_get_current_platform,
+)
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import ENTITY_SETUP_CHUNK_SIZE, LOGGER
+from .coordinator import QLCPlusDataUpdateCoordinator
+
+
+def selected_widget_ids(
+    coordinator: QLCPlusDataUpdateCoordinator, entry: ConfigEntry, widget_type: str
+) -> set[str]:
+    """Return the IDs of the selected widgets of the given type."""
+    selected = set(entry.options.get("selected_widgets") or ())
+
+    return {
+        widget_id
+        for widget_id, widget in coordinator.data.items()
+        if widget["type"] == widget_type and (not selected or widget_id in selected)
+    }
+
+
+async def async_setup_widget_platform(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+    widget_type: str,
+    entity_class: type["QLCPlusWidgetEntity"],
+) -> None:
+    """Set up the entities of a widget platform and keep them in sync.
+
+    Entities are added and removed incrementally when the widget selection or
+    the widget catalog changes, without reloading the config entry.
+    """
+    coordinator: QLCPlusDataUpdateCoordinator = hass.data[entry.entry_id]
+    domain = async_get_current_platform().domain
+    entity_reg = er.async_get(hass)
+    entities: dict[str, QLCPlusWidgetEntity] = {}
+
+    sync_lock = asyncio.Lock()
+
+    async def async_sync_entities() -> None:
+        """Add the newly selected widgets and remove the deselected ones."""
+        async with sync_lock:
+            wanted = selected_widget_ids(coordinator, entry, widget_type)
+            added = [widget_id for widget_id in wanted if widget_id not in entities]
+            removed = [widget_id for widget_id in entities if widget_id not in wanted]
+
+            for widget_id in removed:
+                entity = entities.pop(widget_id)
+                if entity.registry_entry:
+                    entity_reg.async_remove(entity.entity_id)
+                elif entity.hass is not None:
+                    await entity.async_remove()
+                # Otherwise the platform never added the entity, so there is
+                # nothing to remove beyond forgetting it.
+
+            for start in range(0, len(added), ENTITY_SETUP_CHUNK_SIZE):
+                new_entities = [
+                    entity_class(coordinator, entry, coordinator.data[widget_id])
+                    for widget_id in added[start : start + ENTITY_SETUP_CHUNK_SIZE]
+                ]
+                entities.update(
+                    (entity.widget_id, entity) for entity in new_entities
+                )
+                async_add_entities(new_entities)
+                await asyncio.sleep(0)
+
+            if added or removed:
+                LOGGER.debug(
+                    "Synced %s entities: %d added, %d removed",
+                    domain,
+                    len(added),
+                    len(removed),
+                )
+
+    # Drop entities left over from widgets that are no longer selected or that
+    # belonged to another platform before their type was known.
+    suffix = entity_class.unique_id_suffix
+    wanted_unique_ids = {
+        f"{entry.unique_id}_{widget_id}{suffix}"
+        for widget_id in selected_widget_ids(coordinator, entry, widget_type)
+    }
+    widget_unique_ids = {
+        f"{entry.unique_id}_{widget_id}{suffix}" for widget_id in coordinator.data
+    }
+    for registry_entry in er.async_entries_for_config_entry(
+        entity_reg, entry.entry_id
+    ):
+        if (
+            registry_entry.domain == domain
+            and registry_entry.unique_id in widget_unique_ids
+            and registry_entry.unique_id not in wanted_unique_ids
+        ):
+            entity_reg.async_remove(registry_entry.entity_id)
+
+    await async_sync_entities()
+
+    @callback
+    def async_schedule_sync() -> None:
+        """Schedule an entity sync."""
+        entry.async_create_task(hass, async_sync_entities())
+
+    async def async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Sync entities when the widget selection changes."""
+        await async_sync_entities()
+
+    @callback
+    def async_coordinator_updated() -> None:
+        """Sync entities when the widget catalog changes."""
+        if selected_widget_ids(coordinator, entry, widget_type) != entities.keys():
+            async_schedule_sync()
+
+    entry.async_on_unload(entry.add_update_listener(async_options_updated))
+    entry.async_on_unload(coordinator.async_add_listener(async_coordinator_updated))
+
+
+class QLCPlusWidgetEntity(CoordinatorEntity):
+    """Representation of a QLC+ virtual console widget."""
+
+    # Set by platforms that create more than one entity per widget.
+    unique_id_suffix = ""
+    name_suffix = ""
+
+    def __init__(
+        self,
+        coordinator: QLCPlusDataUpdateCoordinator,
+        entry: ConfigEntry,
+        widget: dict,
+    ) -> None:
+        """Initialize the widget entity."""
+        super().__init__(coordinator)
+        self.widget_id = widget["id"]
+        self._attr_unique_id = (
+            f"{entry.unique_id}_{self.widget_id}{self.unique_id_suffix}"
+        )
+        self._attr_name = f"{entry.title} {widget['name']}{self.name_suffix}"
+        self._attr_device_info = coordinator.device_info
+
+    @property
+    def widget_status(self) -> str | None:
+        """Return the last polled status of the widget."""
+        if not self.coordinator.data:
+            return None
+        return self.coordinator.data.get(self.widget_id, {}).get("status")
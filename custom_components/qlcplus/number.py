@@ -2,13 +2,13 @@
 
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import SLIDER_MAX_VALUE, SLIDER_MIN_VALUE, WIDGET_TYPE_SLIDER
 from .coordinator import QLCPlusDataUpdateCoordinator
+from .entity import QLCPlusWidgetEntity, async_setup_widget_platform
 
 
 async def async_setup_entry(
@@ -17,11 +17,18 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the QLC+ number entities."""
-    gm_number = QLCPlusGMNumberEntity(
-        coordinator=hass.data[entry.entry_id], entry=entry
-    ) 
+    coordinator = hass.data[entry.entry_id]
+    gm_number = QLCPlusGMNumberEntity(coordinator=coordinator, entry=entry)
     async_add_entities([gm_number], update_before_add=True)
 
+    await async_setup_widget_platform(
+        hass,
+        entry,
+        async_add_entities,
+        WIDGET_TYPE_SLIDER,
+        QLCPlusSliderNumberEntity,
+    )
+
 
 class QLCPlusGMNumberEntity(CoordinatorEntity, NumberEntity):
     """Representation of the QLC+ GM Slider."""
@@ -31,24 +38,63 @@ class QLCPlusGMNumberEntity(CoordinatorEntity, NumberEntity):
     ) -> None:
         """Initialize the number."""
         super().__init__(coordinator)
-        self._entry = entry
         self._attr_native_step = 1
         self._attr_unique_id = f"{entry.unique_id}_gm"
         self._attr_name = f"{entry.title} GM"
         self._attr_mode = NumberMode.SLIDER
         self._attr_native_max_value = 255
         self._attr_native_min_value = 0
+        self._attr_device_info = coordinator.device_info
+        self._attr_native_value = coordinator.gm_value
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return the device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.unique_id)}, name=self._entry.title
-        )
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        if self.coordinator.gm_value is not None:
+            self._attr_native_value = self.coordinator.gm_value
+        self.async_write_ha_state()
 
     async def async_set_native_value(self, value: float) -> None:
         """Set GM value."""
         gm_value = int(value)
         await self.coordinator.api.set_gm_value(gm_value)
+        self.coordinator.gm_value = gm_value
         self._attr_native_value = gm_value
         self.async_write_ha_state()
+
+
+class QLCPlusSliderNumberEntity(QLCPlusWidgetEntity, NumberEntity):
+    """Representation of a QLC+ slider widget."""
+
+    def __init__(
+        self,
+        coordinator: QLCPlusDataUpdateCoordinator,
+        entry: ConfigEntry,
+        widget: dict,
+    ) -> None:
+        """Initialize the number."""
+        super().__init__(coordinator, entry, widget)
+        self._attr_native_step = 1
+        self._attr_mode = NumberMode.SLIDER
+        self._attr_native_max_value = SLIDER_MAX_VALUE
+        self._attr_native_min_value = SLIDER_MIN_VALUE
+        self._update_native_value()
+
+    def _update_native_value(self) -> None:
+        """Update the value from the last polled widget status."""
+        status = self.widget_status
+        if status is not None and status.isdigit():
+            self._attr_native_value = int(status)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_native_value()
+        self.async_write_ha_state()
+
+    async def async_set_native_value(self, value: float) -> None:
+        """Set slider value."""
+        slider_value = int(value)
+        await self.coordinator.api.set_widget_value(self.widget_id, slider_value)
+        self._attr_native_value = slider_value
+        self.async_write_ha_state()
@@ -0,0 +1,64 @@
+"""Select platform for QLC+ integration."""
+
+from homeassistant.components.select import SelectEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import CUE_LIST_OPTIONS, CUE_LIST_PLAY, WIDGET_TYPE_CUE_LIST
+from .coordinator import QLCPlusDataUpdateCoordinator
+from .entity import QLCPlusWidgetEntity, async_setup_widget_platform
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the QLC+ select platform."""
+    await async_setup_widget_platform(
+        hass,
+        entry,
+        async_add_entities,
+        WIDGET_TYPE_CUE_LIST,
+        QLCPlusCueListSelectEntity,
+    )
+
+
+class QLCPlusCueListSelectEntity(QLCPlusWidgetEntity, SelectEntity):
+    """Representation of a QLC+ cue list widget."""
+
+    def __init__(
+        self,
+        coordinator: QLCPlusDataUpdateCoordinator,
+        entry: ConfigEntry,
+        widget: dict,
+    ) -> None:
+        """Initialize the select."""
+        super().__init__(coordinator, entry, widget)
+        self._attr_options = list(CUE_LIST_OPTIONS)
+        self._update_current_option()
+
+    def _update_current_option(self) -> None:
+        """Update the option from the last polled widget status."""
+        status = self.widget_status
+        if status is not None:
+            self._attr_current_option = (
+                "Play" if status.startswith(CUE_LIST_PLAY) else "Stop"
+            )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_current_option()
+        self.async_write_ha_state()
+
+    async def async_select_option(self, option: str) -> None:
+        """Send the playback command of the selected option."""
+        # PLAY toggles a running cue list, so only send a change of state.
+        if option != self.current_option:
+            await self.coordinator.api.set_widget_value(
+                self.widget_id, CUE_LIST_OPTIONS[option]
+            )
+        self._attr_current_option = option
+        self.async_write_ha_state()